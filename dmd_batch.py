@@ -0,0 +1,186 @@
+##############################################
+# Batched implementation of the standard DMD #
+# method, for many independent flows with    #
+# identical shapes.                          #
+#                                            #
+# Author: Jacob Davison                      #
+# Date:   10/19/2026                         #
+##############################################
+
+import numpy as np
+
+class DMD_BATCH(object):
+    """Standard reduced DMD fit on a stack of independent flows at once. Brunton et al. 2021 (arXiv:2102.12086v2)
+
+    Equivalent to fitting DMD_STD on each flow data[i], but the SVD, reduced operator,
+    eigendecomposition and amplitude solves run as stacked NumPy linear algebra.
+    """
+    def __init__(self):
+        """Class initializer.
+        """
+
+        self._phi = None
+        self._eigs = None
+        self._b = None
+        self._mask = None
+
+    @property
+    def phi(self):
+        return self._phi
+
+    @property
+    def eigs(self):
+        return self._eigs
+
+    @property
+    def b(self):
+        return self._b
+
+    @property
+    def mask(self):
+        return self._mask
+
+    def fit(self, data, nobs, exact=False, r=3, enforce_physics=False):
+        """Build the DMD operators for every flow in the batch.
+
+        Arguments:
+
+        data -- stacked snapshot matrices, shape (B, n, T), one flow per leading index
+        nobs -- number of observations to build each DMD operator
+
+        Keyword arguments:
+
+        exact -- construct the exact DMD operators, given by X*pinv(X) (default: False)
+        r -- truncation rank of SVD on measurement space
+        enforce_physics -- enforce physical constraints on the DMD eigenvalues (default: False)
+        """
+
+        assert data.ndim == 3, "data must be a stack of snapshot matrices with shape (B, n, T)"
+
+        X,Xp = data[:,:,:nobs-1], data[:,:,1:nobs]
+
+        H0 = X[:,:,0]
+
+        if not exact:
+
+            # Compute economy SVD with truncation, for all flows
+            U,s,Vh = np.linalg.svd(X, full_matrices=False)
+
+            s = s[:,0:r]
+            U = U[:,:,0:r]
+            Vh = Vh[:,0:r,:]
+
+            # Xp V sigma^-1; sigma is diagonal, so scale columns instead of inverting
+            XpVSinv = Xp@np.conj(np.swapaxes(Vh, 1, 2))/s[:,np.newaxis,:]
+
+            # Compute DMD operators
+            A = np.conj(np.swapaxes(U, 1, 2))@XpVSinv
+
+            # Compute eigendecompositions; np.linalg.eig returns real dtype when the whole
+            # stack has real spectra, so cast to complex as scipy.linalg.eig in DMD_STD does
+            w,v = np.linalg.eig(A)
+            w,v = w.astype(complex),v.astype(complex)
+
+            # Compute DMD modes; modes with an exactly-zero eigenvalue are set to zero
+            # rather than inf, so they cannot poison the amplitude solve for the flow
+            nonzero = (w != 0)[:,np.newaxis,:]
+            phi = np.divide(XpVSinv@v, np.where(nonzero, w[:,np.newaxis,:], 1.0))
+            phi = np.where(nonzero, phi, 0.0)
+
+        else:
+
+            # Compute the exact DMD
+            A = Xp@np.linalg.pinv(X)
+
+            # Compute eigendecompositions
+            w,phi = np.linalg.eig(A)
+            w,phi = w.astype(complex),phi.astype(complex)
+
+        # Compute DMD amplitudes (minimum-norm least squares, as gelsd)
+        b = (np.linalg.pinv(phi)@H0[:,:,np.newaxis])[:,:,0]
+
+        mask = np.ones(w.shape, dtype=bool)
+
+        if enforce_physics:
+            # real eigs
+            w = np.real(w)
+
+            # positive eigs; masked modes are kept in place but switched off
+            mask = w > 0
+            w = np.where(mask, w, 1.0)
+            b = np.where(mask, b, 0.0)
+            phi = np.where(mask[:,np.newaxis,:], phi, 0.0)
+
+            # set "background"; masked modes sort to the end
+            sorted_idx = np.argsort(np.where(mask, -w, np.inf), axis=1, kind='stable')
+            w = np.take_along_axis(w, sorted_idx, axis=1)
+            b = np.take_along_axis(b, sorted_idx, axis=1)
+            mask = np.take_along_axis(mask, sorted_idx, axis=1)
+            phi = np.take_along_axis(phi, sorted_idx[:,np.newaxis,:], axis=2)
+
+            w[:,0] = np.where(mask[:,0] & (w[:,0] > 1), 1.0, w[:,0])
+
+        # Set class attributes
+        self._phi = phi
+        self._eigs = w
+        self._b = b
+        self._mask = mask
+
+    def predict(self, s_range, ds):
+        """Emulate every dynamical system in the batch over the specified range.
+
+        Arguments:
+
+        s -- dynamical variable range (list of numbers to evaluate DMD expansion)
+        ds -- stepwidth for continuous time
+
+        Returns:
+
+        reconstructed_data -- stack of reconstructed snapshot matrices, shape (B, n, len(s_range))
+        """
+
+        assert self.phi is not None, "Build DMD operators first via fit()"
+
+        s_range = np.asarray(s_range)
+
+        # time dynamics for every mode and s, shape (B, r, len(s_range))
+        dynamics = np.exp(np.log(self.eigs)[:,:,np.newaxis]/ds*s_range)*self.b[:,:,np.newaxis]
+
+        reconstructed_data = np.real(self.phi@dynamics)
+
+        return reconstructed_data
+
+if __name__ == "__main__":
+
+    # Equivalence check against DMD_STD fit on each flow: random snapshots give
+    # DMD spectra with negative and complex eigenvalues, and a linear flow with
+    # A = diag(0.9, -0.6, 0.5) gives a stack whose spectra are all real.
+    from imsrg_emu.dmd_std import DMD_STD
+
+    rng = np.random.default_rng(0)
+    s_range = np.arange(0, 4.0, 0.1)
+
+    random_data = rng.random((6,30,40)) + np.linspace(1, 0.5, 40)
+
+    Q = np.linalg.qr(rng.standard_normal((30,3)))[0]
+    linear_data = np.stack([Q@(np.array([0.9, -0.6, 0.5])[:,np.newaxis]**np.arange(40)*rng.random((3,1))) for i in range(4)])
+
+    for data,r in [(random_data, 8), (linear_data, 3)]:
+        for exact in [False, True]:
+            for enforce_physics in [False, True]:
+                if exact and data is random_data:
+                    continue
+
+                dmd_batch = DMD_BATCH()
+                dmd_batch.fit(data, 20, exact=exact, r=r, enforce_physics=enforce_physics)
+                pred_batch = dmd_batch.predict(s_range, 0.1)
+
+                for i in range(data.shape[0]):
+                    dmd = DMD_STD()
+                    dmd.fit(data[i], 20, exact=exact, r=r, enforce_physics=enforce_physics)
+                    pred = dmd.predict(s_range, 0.1)
+
+                    assert np.all(np.isfinite(pred_batch[i])), "non-finite batched prediction"
+                    assert np.allclose(pred, pred_batch[i], rtol=1e-8, atol=1e-8), "batched prediction differs from DMD_STD"
+
+                print("exact={}, enforce_physics={}: DMD_BATCH matches DMD_STD on {} flows".format(exact, enforce_physics, data.shape[0]))
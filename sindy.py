@@ -0,0 +1,344 @@
+##############################################
+# Implementation of the SINDy method in the  #
+# reduced SVD coordinates of the data.       #
+#                                            #
+# Author: Jacob Davison                      #
+# Date:   10/19/2026                         #
+##############################################
+
+import itertools
+import warnings
+
+import scipy.linalg as la
+import numpy as np
+
+class SINDY(object):
+    """Sparse Identification of Nonlinear Dynamics in reduced SVD coordinates. Brunton et al. 2016 (arXiv:1509.03580)
+
+    The snapshots are projected onto the leading r left singular vectors, z = Ur^H x, and
+    a sparse polynomial model dz/ds = Theta(z) Xi is found by sequentially-thresholded
+    least squares (STLSQ). Model degrees are tried from 1 upward; the lowest degree that
+    reproduces the training snapshots best is kept.
+    """
+    def __init__(self):
+        """Class initializer.
+        """
+
+        self._Ur = None
+        self._Z = None
+        self._powers = None
+        self._xi = None
+        self._degree = None
+
+        # cached normal equations, Theta^T Theta and Theta^T dZ, and ||dZ|| per coordinate
+        self._gram = None
+        self._rhs = None
+        self._dZ_norms = None
+
+    @property
+    def Ur(self):
+        return self._Ur
+
+    @property
+    def z0(self):
+        return None if self._Z is None else self._Z[:,0]
+
+    @property
+    def powers(self):
+        return self._powers
+
+    @property
+    def xi(self):
+        return self._xi
+
+    @property
+    def degree(self):
+        return self._degree
+
+    @property
+    def gram(self):
+        return self._gram
+
+    @staticmethod
+    def library_powers(r, degree):
+        """Exponents of every monomial in r variables, of degree 1 up to the given degree.
+
+        There is no constant term. A flow that relaxes to a fixed point has the fixed point in
+        the span of its snapshots, so a constant column is a linear combination of the linear
+        terms and only makes the normal equations singular.
+
+        Returns:
+
+        powers -- integer matrix (n_terms, r); row k gives the exponents of term k
+        """
+        powers = []
+        for d in range(1, degree+1):
+            for combo in itertools.combinations_with_replacement(range(r), d):
+                powers.append(np.bincount(combo, minlength=r))
+
+        return np.array(powers)
+
+    def library(self, Z):
+        """Evaluate the candidate library on reduced states.
+
+        Arguments:
+
+        Z -- matrix of reduced state columns, shape (r, m)
+
+        Returns:
+
+        theta -- library matrix, shape (m, n_terms)
+        """
+        return np.prod(Z.T[:,np.newaxis,:]**self._powers[np.newaxis,:,:], axis=2)
+
+    def fit(self, data, nobs, r=3, degree=2, threshold=1e-3, alpha=0.0, tol=1e-4, max_iter=10):
+        """Build the SINDy model.
+
+        Arguments:
+
+        data -- matrix of snapshot columns, of the evolving dynamical system
+        nobs -- number of observations to build the SINDy model
+
+        Keyword arguments:
+
+        r -- truncation rank of SVD on measurement space (int), or singular value tolerance (float)
+        degree -- maximum polynomial degree in the candidate library (default: 2)
+        threshold -- nonlinear coefficients below this are zeroed; coefficients are relative, with library
+                     columns and derivatives both normalized to unit norm (default: 1e-3)
+        alpha -- ridge regularization on the normalized normal equations (default: 0.0)
+        tol -- stop raising the degree once the relative fit residual is below this (default: 1e-4)
+        max_iter -- maximum number of STLSQ iterations (default: 10)
+        """
+
+        X = data[:,:nobs]
+
+        # Compute economy SVD with truncation
+        U,s,Vh = la.svd(X, full_matrices=False)
+
+        if isinstance(r, float):
+            r = len(np.argwhere(s > r)[:,0])
+
+        # cannot keep more coordinates than the numerical rank of the snapshots
+        r = min(r, len(np.argwhere(s > s[0]*max(X.shape)*np.finfo(s.dtype).eps)[:,0]))
+
+        Ur = U[:,0:r]
+
+        # Reduced coordinates, z_k = Ur^H x_k; the step z_{k+1} - z_k is paired with the
+        # midpoint (z_k + z_{k+1})/2, which is second-order accurate and has no endpoint bias
+        Z = np.diag(s[0:r])@Vh[0:r,:]
+        dZ = Z[:,1:] - Z[:,:-1]
+        Zmid = (Z[:,1:] + Z[:,:-1])/2
+
+        self._Ur = Ur
+        self._Z = Z
+        self._powers = self.library_powers(r, degree)
+
+        # Evaluate library once and cache the normal equations
+        theta = self.library(Zmid)
+        self._gram = theta.T@theta
+        self._rhs = theta.T@dZ.T
+        self._dZ_norms = np.linalg.norm(dZ, axis=1)
+
+        self.refit(threshold=threshold, alpha=alpha, tol=tol, max_iter=max_iter)
+
+    def refit(self, threshold=1e-3, alpha=0.0, tol=1e-4, max_iter=10):
+        """Rerun the degree selection and STLSQ on the cached normal equations, e.g. to scan the threshold.
+        """
+
+        assert self._gram is not None, "Build SINDy model first via fit()"
+
+        term_degrees = np.sum(self._powers, axis=1)
+        dZ_norms = np.where(self._dZ_norms == 0, 1.0, self._dZ_norms)
+        nobs = self._Z.shape[1]
+
+        best = None
+        for d in range(1, term_degrees[-1]+1):
+            xi = self._stlsq(term_degrees <= d, threshold, alpha, max_iter)
+
+            # relative residual of each coordinate, from the normal equations
+            sq_res = self._dZ_norms**2 - 2*np.sum(xi*self._rhs, axis=0) + np.sum(xi*(self._gram@xi), axis=0)
+            residual = np.max(np.sqrt(np.maximum(sq_res, 0))/dZ_norms)
+
+            # error in reproducing the training snapshots, in units of one snapshot step
+            Z_pred = self._integrate(xi, np.arange(nobs), 1.0)
+            error = np.linalg.norm(Z_pred - self._Z)/np.linalg.norm(self._Z)
+            if not np.isfinite(error):
+                error = np.inf
+
+            if best is None or error < best[0]:
+                best = (error, xi, d)
+
+            if residual <= tol:
+                break
+
+        self._xi = best[1]
+        self._degree = best[2]
+
+    def _stlsq(self, keep, threshold, alpha, max_iter):
+        """Sequentially-thresholded least squares on the cached normal equations, over the terms in keep.
+
+        Linear terms are never thresholded: in rotated SVD coordinates the linear part is dense, and
+        dropping any of it damps or excites modes. Sparsity applies to the nonlinear terms.
+        """
+
+        # Normalize library columns and derivatives, so the threshold does not
+        # depend on the scale of the data
+        norms = np.sqrt(np.diag(self._gram))[keep]
+        norms[norms == 0] = 1.0
+        dZ_norms = np.where(self._dZ_norms == 0, 1.0, self._dZ_norms)
+        G = self._gram[np.ix_(keep,keep)]/np.outer(norms, norms) + alpha*np.eye(len(norms))
+        rhs = self._rhs[keep]/np.outer(norms, dZ_norms)
+
+        n_terms, r = rhs.shape
+        linear = (np.sum(self._powers[keep], axis=1) == 1)[:,np.newaxis]
+
+        xi = la.lstsq(G, rhs, lapack_driver='gelsd')[0]
+        active = (np.abs(xi) >= threshold) | linear
+
+        for it in range(max_iter):
+            xi = np.zeros((n_terms, r))
+            for j in range(r):
+                idx = np.argwhere(active[:,j])[:,0]
+                xi[idx,j] = la.lstsq(G[np.ix_(idx,idx)], rhs[idx,j], lapack_driver='gelsd')[0]
+
+            new_active = (np.abs(xi) >= threshold) | linear
+            if np.array_equal(new_active, active):
+                break
+            active = new_active
+
+        xi[~active] = 0.0
+
+        full_xi = np.zeros((len(self._powers), r))
+        full_xi[keep] = xi*np.outer(np.reciprocal(norms), dZ_norms)
+
+        return full_xi
+
+    def _integrate(self, xi, s_range, ds):
+        """Integrate dz/ds = Theta(z) Xi/ds from z0 at s = 0 with fixed-step RK4.
+
+        Each interval between requested points (including 0 to s_range[0], which may be
+        negative) is split into equal substeps no longer than ds. States from the first
+        non-finite one onward are NaN.
+        """
+        xi = xi/ds
+        Z = np.full((len(self.z0), len(s_range)), np.nan)
+
+        def rhs(z):
+            return (self.library(z[:,np.newaxis])@xi)[0]
+
+        z = self.z0
+        s_prev = 0.0
+
+        # divergence is detected below, so numpy need not warn about it
+        with np.errstate(over='ignore', invalid='ignore'):
+            for k,s in enumerate(s_range):
+                nsteps = int(np.ceil(abs(s - s_prev)/ds - 1e-9))
+                if nsteps > 0:
+                    h = (s - s_prev)/nsteps
+                    for step in range(nsteps):
+                        k1 = rhs(z)
+                        k2 = rhs(z + h/2*k1)
+                        k3 = rhs(z + h/2*k2)
+                        k4 = rhs(z + h*k3)
+                        z = z + h/6*(k1 + 2*k2 + 2*k3 + k4)
+
+                if not np.all(np.isfinite(z)):
+                    break
+
+                Z[:,k] = z
+                s_prev = s
+
+        return Z
+
+    def predict(self, s_range, ds):
+        """Emulate the dynamical system over the specified range.
+
+        Arguments:
+
+        s -- dynamical variable range (list of numbers to evaluate SINDy model); s = 0 is the first snapshot
+        ds -- stepwidth for continuous time
+
+        Returns:
+
+        reconstructed_data -- matrix of reconstructed snaphots from the SINDy model built by fit()
+        """
+
+        assert self.xi is not None, "Build SINDy model first via fit()"
+
+        s_range = np.asarray(s_range)
+        Z = self._integrate(self.xi, s_range, ds)
+
+        # remaining snapshots are left as NaN
+        blowup = np.argwhere(np.isnan(Z[0]))[:,0]
+        if len(blowup) > 0:
+            warnings.warn("SINDy model diverged; snapshots from s = {} onward are NaN".format(s_range[blowup[0]]), RuntimeWarning)
+
+        reconstructed_data = np.real(self.Ur@Z)
+
+        return reconstructed_data
+
+if __name__ == "__main__":
+
+    # Self-check on flows with known dynamics.
+    from scipy.integrate import solve_ivp
+
+    rng = np.random.default_rng(0)
+
+    # 1. Linear flow relaxing to a fixed point, like an IMSRG flow: four decaying exponentials.
+    #    The model should stay linear (no nonlinear terms), reproduce the training snapshots,
+    #    and extrapolate.
+    ds = 0.1
+    s_range = np.arange(0, 20+ds, ds)
+    rates = np.array([0.0, 0.3, 0.8, 1.5])
+    data = rng.standard_normal((50,4))@(np.array([3.0, 1.0, 0.5, 0.2])[:,np.newaxis]*np.exp(-np.outer(rates, s_range)))
+
+    for nobs,r in [(10,6), (20,6), (40,4)]:
+        sindy = SINDY()
+        sindy.fit(data, nobs, r=r)
+        pred = sindy.predict(s_range, ds)
+        rel_err = np.linalg.norm(pred - data, axis=0)/np.linalg.norm(data, axis=0)
+
+        assert sindy.degree == 1 and not np.any(sindy.xi[np.sum(sindy.powers, axis=1) > 1]), "nonlinear terms in a linear flow"
+        assert np.max(rel_err[:nobs]) < 1e-3, "training snapshots not reproduced"
+        assert np.max(rel_err) < 1e-3, "extrapolation of linear flow failed"
+
+        print("linear flow, nobs={}, r={}: degree {}, max relative error {:.1e}".format(nobs, r, sindy.degree, np.max(rel_err)))
+
+    # README settings truncate the same flow below its rank (r=3 < 4); the fit must stay finite
+    sindy = SINDY()
+    sindy.fit(data, 20, r=3)
+    pred = sindy.predict(s_range, ds)
+    rel_err = np.linalg.norm(pred - data, axis=0)/np.linalg.norm(data, axis=0)
+
+    assert np.all(np.isfinite(pred)), "truncated linear flow diverged"
+    assert np.max(rel_err[:20]) < 1e-2, "training snapshots not reproduced"
+
+    print("linear flow, nobs=20, r=3: degree {}, max relative error {:.1e}".format(sindy.degree, np.max(rel_err)))
+
+    # 2. Quadratic flow dy/ds = f(y), embedded in 40 dimensions. In SVD coordinates z = R y,
+    #    with R orthogonal, so the exact model is dz/ds = R f(R^T z), a known quadratic.
+    def f(s, y):
+        return np.array([-0.5*y[0], -0.2*y[1] + 0.3*y[0]**2])
+
+    ds = 0.05
+    s_range = np.arange(0, 10+ds, ds)
+    Q = la.qr(rng.standard_normal((40,2)), mode='economic')[0]
+    data = Q@solve_ivp(f, (0, s_range[-1]), [2.0, 1.0], t_eval=s_range, rtol=1e-12, atol=1e-12).y
+
+    for nobs in [20, 40]:
+        sindy = SINDY()
+        sindy.fit(data, nobs, r=2)
+        pred = sindy.predict(s_range, ds)
+        rel_err = np.linalg.norm(pred - data, axis=0)/np.linalg.norm(data, axis=0)
+
+        # exact Xi, per snapshot step, from the library on random states
+        R = sindy.Ur.T@Q
+        Z = rng.standard_normal((2,50))
+        F = np.array([R@f(0, R.T@z) for z in Z.T])*ds
+        xi_exact = la.lstsq(sindy.library(Z), F)[0]
+
+        xi_err = np.max(np.abs(sindy.xi - xi_exact))/np.max(np.abs(xi_exact))
+        assert sindy.degree == 2 and xi_err < 1e-3, "quadratic model not recovered"
+        assert np.max(rel_err[:nobs]) < 1e-4, "training snapshots not reproduced"
+
+        print("quadratic flow, nobs={}: degree {}, relative Xi error {:.1e}, max relative error {:.1e}".format(nobs, sindy.degree, xi_err, np.max(rel_err)))
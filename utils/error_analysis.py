@@ -0,0 +1,148 @@
+###############################################################
+# Vectorized error metrics for comparing emulated snapshots   #
+# against the true flow. Inputs may be in-memory arrays,      #
+# memmaps, or paths to .npy files (opened as memmaps).        #
+#                                                             #
+# Author: Jacob Davison                                       #
+# Date:   10/19/2026                                          #
+###############################################################
+
+import numpy as np
+
+def load_snapshots(data):
+    """Return a snapshot matrix, memory-mapping .npy files from disk.
+
+    Arguments:
+
+    data -- numpy array, memmap, or path to a .npy file (snapshot columns)
+    """
+    if isinstance(data, str):
+        return np.load(data, mmap_mode='r')
+
+    return data
+
+def _blocked_sq_norms(predict_data, true_data, block_size):
+    """Accumulate squared column norms of (predict - true) and true.
+
+    Blocks are taken along the contiguous axis of the true data, so a
+    memmapped matrix is streamed from disk in order, one block at a time.
+    """
+    nrows, ncols = true_data.shape
+    sq_diff = np.zeros(ncols)
+    sq_true = np.zeros(ncols)
+
+    if true_data.flags['F_CONTIGUOUS'] and not true_data.flags['C_CONTIGUOUS']:
+        # column blocks; each block holds full columns
+        for start in range(0, ncols, block_size):
+            stop = min(start+block_size, ncols)
+            T = np.asarray(true_data[:, start:stop])
+            D = np.asarray(predict_data[:, start:stop]) - T
+            sq_diff[start:stop] = np.einsum('ij,ij->j', D, D)
+            sq_true[start:stop] = np.einsum('ij,ij->j', T, T)
+    else:
+        # row blocks; partial column sums accumulated across blocks
+        for start in range(0, nrows, block_size):
+            stop = min(start+block_size, nrows)
+            T = np.asarray(true_data[start:stop, :])
+            D = np.asarray(predict_data[start:stop, :]) - T
+            sq_diff += np.einsum('ij,ij->j', D, D)
+            sq_true += np.einsum('ij,ij->j', T, T)
+
+    return sq_diff, sq_true
+
+def relative_frobenius_error(predict_data, true_data, block_size=256):
+    """Compute ||H_pred(s) - H_true(s)||_F / ||H_true(s)||_F for every s.
+
+    Arguments:
+
+    predict_data -- matrix of emulated snapshot columns (array, memmap, or .npy path)
+    true_data -- matrix of true snapshot columns, same shape as predict_data
+
+    Keyword arguments:
+
+    block_size -- number of rows (or columns) held in memory at once (default: 256)
+
+    Returns:
+
+    rel_err -- relative Frobenius error for each snapshot column
+    """
+    predict_data = load_snapshots(predict_data)
+    true_data = load_snapshots(true_data)
+
+    assert predict_data.shape == true_data.shape, "matrices shape {}, {} are not compatible".format(predict_data.shape, true_data.shape)
+
+    sq_diff, sq_true = _blocked_sq_norms(predict_data, true_data, block_size)
+
+    return np.sqrt(sq_diff/sq_true)
+
+def energy_error(predict_data, true_data, relative=False):
+    """Compute the error in the energy (first row of the snapshots) for every s.
+
+    Arguments:
+
+    predict_data -- matrix of emulated snapshot columns (array, memmap, or .npy path)
+    true_data -- matrix of true snapshot columns, same shape as predict_data
+
+    Keyword arguments:
+
+    relative -- divide by |E_true(s)| (default: False)
+
+    Returns:
+
+    E_err -- absolute (or relative) energy error for each snapshot column
+    """
+    E_pred = np.asarray(load_snapshots(predict_data)[0, :])
+    E_true = np.asarray(load_snapshots(true_data)[0, :])
+
+    E_err = np.abs(E_pred - E_true)
+    if relative:
+        E_err = E_err/np.abs(E_true)
+
+    return E_err
+
+def error_at_s(s_range, errors, s):
+    """Evaluate an error curve at the requested s, interpolating between grid points.
+
+    Arguments:
+
+    s_range -- dynamical variable range that the errors were computed on
+    errors -- error for each s in s_range (e.g. output of relative_frobenius_error)
+    s -- value(s) of s to evaluate, e.g. extrapolated points past the training window;
+         must lie within [s_range[0], s_range[-1]]
+    """
+    s_arr = np.asarray(s)
+    if np.any(s_arr < s_range[0]) or np.any(s_arr > s_range[-1]):
+        raise ValueError("s = {} is outside the range [{}, {}] the errors were computed on".format(s, s_range[0], s_range[-1]))
+
+    return np.interp(s, s_range, errors)
+
+def error_summary(s_range, predict_data, true_data, nobs, block_size=256):
+    """Summarize emulator error inside and beyond the training window.
+
+    Arguments:
+
+    s_range -- dynamical variable range of the snapshot columns
+    predict_data -- matrix of emulated snapshot columns (array, memmap, or .npy path)
+    true_data -- matrix of true snapshot columns, same shape as predict_data
+    nobs -- number of observations used to build the emulator
+
+    Keyword arguments:
+
+    block_size -- number of rows (or columns) held in memory at once (default: 256)
+
+    Returns:
+
+    summary -- dict of per-s error curves and scalar extrapolation metrics
+    """
+    rel_err = relative_frobenius_error(predict_data, true_data, block_size=block_size)
+    E_err = energy_error(predict_data, true_data)
+
+    summary = {'rel_frob': rel_err,
+               'energy': E_err,
+               'max_rel_frob_train': np.max(rel_err[:nobs]),
+               'max_rel_frob_extrap': np.max(rel_err[nobs:]) if len(rel_err) > nobs else np.nan,
+               'final_rel_frob': rel_err[-1],
+               'final_energy': E_err[-1],
+               's_final': s_range[-1]}
+
+    return summary
@@ -22,7 +22,13 @@ def make_argparser():
     parser_par.add_argument('--testPath', '-tp', default=None, help='/path/to/test/data; CSV with rows of snapshots of data to test (mostly for plotting)')
     parser_par.add_argument('--emuType', '-e', required=True, choices=['rKOI', 'rEPI'], help='Choice of parametric emulator type. Choices are reduced Koopman Interpolation (rKOI) and reduced Eigenpair Interpolation (rEPI).')
 
-    for subparser in [parser_std, parser_par]:
+    parser_sindy = subparsers.add_parser('sindy', help='run a SINDy emulation on the data, in reduced SVD coordinates')
+    parser_sindy.add_argument('dataPath', help='path/to/data/file; CSV with rows of snapshots')
+    parser_sindy.add_argument('--degree', '-d', type=int, default=2, help='maximum polynomial degree in the SINDy candidate library')
+    parser_sindy.add_argument('--threshold', type=float, default=1e-3, help='STLSQ sparsity threshold on relative nonlinear coefficients (library columns and derivatives normalized to unit norm)')
+    parser_sindy.add_argument('--alpha', type=float, default=0.0, help='ridge regularization in STLSQ')
+
+    for subparser in [parser_std, parser_par, parser_sindy]:
         subparser.add_argument('-N', '--nobs', type=int, default=10, help='number of snapshots per DMD operator')
         subparser.add_argument('-E', '--exact', type=bool, default=False, help='True or False: compute DMD operator exactly instead of reduced')
         subparser.add_argument('-T', '--trunc', type=int, default=6, help='SVD truncation rank in reduced DMD')
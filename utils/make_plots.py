@@ -5,6 +5,8 @@ import matplotlib.pyplot as plt
 import os
 from matplotlib.ticker import AutoMinorLocator
 
+from imsrg_emu.utils.error_analysis import load_snapshots, relative_frobenius_error
+
 plot_dir = "plots/"
 
 
@@ -20,8 +22,10 @@ sns.set_style({"xtick.direction": "in","ytick.direction": "in"})
 
 def make_energy_plots(s_range, predict_data, true_data, exec_args):
 
-    if not os.path.exists(plot_dir):
-        os.mkdir(plot_dir)
+    os.makedirs(plot_dir, exist_ok=True)
+
+    predict_data = np.asarray(load_snapshots(predict_data))
+    true_data = np.asarray(load_snapshots(true_data))
 
     plot_fname = plot_dir+"E_flow_{}_{}_{}_{:0.2f}_{:0.2f}_{:0.2f}.pdf".format(exec_args["nobs"], 
                                                                                int(exec_args["exact"]), 
@@ -50,10 +54,10 @@ def make_energy_plots(s_range, predict_data, true_data, exec_args):
     
     fig.tight_layout()
     fig.savefig(plot_fname)
+    plt.close(fig)
     
 def make_correlation_plots(s_range, predict_data, true_data, exec_args):
-    if not os.path.exists(plot_dir):
-        os.mkdir(plot_dir)
+    os.makedirs(plot_dir, exist_ok=True)
 
     plot_fname = plot_dir+"Corr_flow_{}_{}_{}_{:0.2f}_{:0.2f}_{:0.2f}.pdf".format(exec_args["nobs"], 
                                                                                   int(exec_args["exact"]), 
@@ -68,11 +72,12 @@ def make_correlation_plots(s_range, predict_data, true_data, exec_args):
         a.yaxis.set_minor_locator(AutoMinorLocator())
         
 
-    sns.lineplot(x=s_range, y=[np.linalg.norm(predict_data[:,i] - true_data[:,i])/np.linalg.norm(true_data[:,i]) for i in range(true_data.shape[1])], ax=axes)        
+    sns.lineplot(x=s_range, y=relative_frobenius_error(predict_data, true_data), ax=axes)
 
     axes.set_ylabel(r"$\frac{||H_{DMD}(s) - H_{IMSRG}(s)||_F}{||H_{IMSRG}(s)||_F}$")
     axes.set_xlabel("s")
         
     fig.tight_layout()
     fig.savefig(plot_fname)
+    plt.close(fig)
     
@@ -0,0 +1,96 @@
+###############################################################
+# Render plots in a background process pool. The plotting     #
+# stack is imported once per worker (in the initializer), so  #
+# the emulator process never imports matplotlib and figures   #
+# render while emulation continues.                           #
+#                                                             #
+# Author: Jacob Davison                                       #
+# Date:   10/19/2026                                          #
+###############################################################
+
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+
+_PLOT_ROUTINES = ('make_energy_plots', 'make_correlation_plots')
+_PLOT_STACK = ('matplotlib', 'seaborn', 'pandas')
+
+def _init_worker(plot_dir):
+    """Import the plotting stack and set the output directory in a worker.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+    import imsrg_emu.utils.make_plots as mp
+    mp.plot_dir = plot_dir
+
+def _ready():
+    return None
+
+def _render(routine, args, kwargs):
+    import imsrg_emu.utils.make_plots as mp
+    getattr(mp, routine)(*args, **kwargs)
+
+class PlotPool(object):
+    """Background pool of plotting workers.
+
+    Usage:
+
+        pool = PlotPool("std_plots/")
+        pool.submit('make_energy_plots', s_range, pred[0,:], test_data[0,:], args)
+        ...
+        pool.close()
+    """
+    def __init__(self, plot_dir="plots/", max_workers=2):
+        """Class initializer; workers start importing the plotting stack right away.
+
+        Keyword arguments:
+
+        plot_dir -- directory to write figures to (default: plots/)
+        max_workers -- number of plotting processes (default: 2)
+        """
+        # check here, since an import error in a worker only surfaces as BrokenProcessPool
+        missing = [name for name in _PLOT_STACK if importlib.util.find_spec(name) is None]
+        if missing:
+            raise ImportError("plotting requires {}, which could not be found".format(", ".join(missing)))
+
+        self._executor = ProcessPoolExecutor(max_workers=max_workers,
+                                             initializer=_init_worker,
+                                             initargs=(plot_dir,))
+        self._futures = []
+
+        # warm up the workers so the import overlaps with emulation
+        for i in range(max_workers):
+            self._futures.append(self._executor.submit(_ready))
+
+    def submit(self, routine, *args, **kwargs):
+        """Queue a plotting routine from make_plots.
+
+        Large snapshot matrices can be passed as paths to .npy files, which
+        are memory-mapped in the worker instead of pickled.
+
+        Arguments:
+
+        routine -- name of the plotting routine in make_plots
+        args, kwargs -- passed to the plotting routine
+        """
+        assert routine in _PLOT_ROUTINES, "unknown plotting routine {}; choices are {}".format(routine, _PLOT_ROUTINES)
+
+        future = self._executor.submit(_render, routine, args, kwargs)
+        self._futures.append(future)
+
+        return future
+
+    def close(self, wait=True):
+        """Shut down the pool, re-raising the first error from any plot.
+        """
+        self._executor.shutdown(wait=wait)
+
+        if wait:
+            for future in self._futures:
+                future.result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(wait=exc_type is None)